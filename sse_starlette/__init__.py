@@ -1,5 +1,5 @@
-from sse_starlette.event import ServerSentEvent
+from sse_starlette.event import ServerSentEvent, encode_many
 from sse_starlette.sse import EventSourceResponse
 
-__all__ = ["EventSourceResponse", "ServerSentEvent"]
+__all__ = ["EventSourceResponse", "ServerSentEvent", "encode_many"]
 __version__ = "2.2.1"
@@ -0,0 +1,50 @@
+"""
+Byte-level helpers shared by the event encoders.
+"""
+
+from typing import Any, Dict, List
+
+
+# Encoded retry values; streams reuse a handful of fixed reconnection delays
+RETRY_BYTES: Dict[int, bytes] = {}
+RETRY_BYTES_MAX = 256
+
+
+def encode_retry(retry: int) -> bytes:
+    encoded = b"%d" % retry
+    if len(RETRY_BYTES) < RETRY_BYTES_MAX:
+        RETRY_BYTES[retry] = encoded
+    return encoded
+
+
+def encode_text(value: Any) -> bytes:
+    # str-mode fields are encoded to UTF-8 one by one and the frame is split
+    # and assembled as bytes: UTF-8 never produces CR/LF bytes inside a
+    # multi-byte character, so splitting after encoding is equivalent.
+    # Fields are stringified in __init__, but stay public attributes that
+    # callers may reassign, so non-str values are still handled here.
+    return (value if type(value) is str else str(value)).encode("utf-8")
+
+
+def split_lines(data: bytes) -> List[bytes]:
+    # bytes.splitlines() only breaks on CR, LF and CR+LF, which is exactly the
+    # SSE definition of a line terminator (str.splitlines() is not).
+    lines = data.splitlines()
+    if not data or data[-1:] in (b"\r", b"\n"):
+        # Keep the trailing empty line that splitlines() drops
+        lines.append(b"")
+    return lines
+
+
+def join_tagged_lines(tag: bytes, data: bytes, sep: bytes) -> bytes:
+    # "<tag><line>" for every line in data, joined by sep
+    if len(data) >= 64 and b"\r" not in data:
+        # LF-only payloads: the CR probe and replace() both scan with memchr,
+        # which libc vectorises, instead of materialising a list of lines.
+        return tag + data.replace(b"\n", sep + tag)
+    return tag + (sep + tag).join(split_lines(data))
+
+
+def encode_data_only(data: bytes, sep: bytes) -> bytes:
+    # Frame for an event that carries nothing but data, the common case
+    return b"".join((join_tagged_lines(b"data: ", data, sep), sep, sep))
@@ -0,0 +1,82 @@
+"""
+Numba kernels behind ``event_function.event_from_bytes``.
+
+Importing this module pulls in numpy and numba, so it is only imported lazily
+by :func:`sse_starlette.event_function.load_numba_formatter`.
+"""
+
+import numpy as np
+from numba import njit  # type: ignore[import-not-found, import-untyped, unused-ignore]
+
+HAS_COMMENT = 1
+HAS_ID = 2
+HAS_EVENT = 4
+HAS_DATA = 8
+HAS_RETRY = 16
+
+# Length of the longest tag ("event: " / "retry: ")
+MAX_TAG_LEN = 7
+
+_TAG_COMMENT = np.frombuffer(b": ", np.uint8)
+_TAG_ID = np.frombuffer(b"id: ", np.uint8)
+_TAG_EVENT = np.frombuffer(b"event: ", np.uint8)
+_TAG_DATA = np.frombuffer(b"data: ", np.uint8)
+_TAG_RETRY = np.frombuffer(b"retry: ", np.uint8)
+
+
+@njit(cache=True)  # type: ignore[misc, unused-ignore]
+def _copy(out, pos, src):
+    # Explicit loop: slice assignment checks for overlap and may allocate
+    for c in src:
+        out[pos] = c
+        pos += 1
+    return pos
+
+
+@njit(cache=True)  # type: ignore[misc, unused-ignore]
+def _write_lines(out, pos, tag, field, sep):
+    # One "<tag><line><sep>" per CR, LF or CR+LF terminated line
+    start = 0
+    i = 0
+    n = field.shape[0]
+    while i < n:
+        c = field[i]
+        if c == 13 or c == 10:
+            pos = _copy(out, pos, tag)
+            pos = _copy(out, pos, field[start:i])
+            pos = _copy(out, pos, sep)
+            if c == 13 and i + 1 < n and field[i + 1] == 10:
+                i += 1
+            start = i + 1
+        i += 1
+    pos = _copy(out, pos, tag)
+    pos = _copy(out, pos, field[start:])
+    return _copy(out, pos, sep)
+
+
+@njit(cache=True)  # type: ignore[misc, unused-ignore]
+def _write_stripped(out, pos, tag, field, sep):
+    # "<tag><field without CR/LF><sep>"
+    pos = _copy(out, pos, tag)
+    for c in field:
+        if c != 13 and c != 10:
+            out[pos] = c
+            pos += 1
+    return _copy(out, pos, sep)
+
+
+@njit(cache=True)  # type: ignore[misc, unused-ignore]
+def format_sse_bytes(out, data, event, id_, retry, comment, sep, fields):
+    """Write the SSE frame into ``out`` and return the number of bytes used."""
+    pos = 0
+    if fields & HAS_COMMENT:
+        pos = _write_lines(out, pos, _TAG_COMMENT, comment, sep)
+    if fields & HAS_ID:
+        pos = _write_stripped(out, pos, _TAG_ID, id_, sep)
+    if fields & HAS_EVENT:
+        pos = _write_stripped(out, pos, _TAG_EVENT, event, sep)
+    if fields & HAS_DATA:
+        pos = _write_lines(out, pos, _TAG_DATA, data, sep)
+    if fields & HAS_RETRY:
+        pos = _write_stripped(out, pos, _TAG_RETRY, retry, sep)
+    return _copy(out, pos, sep)
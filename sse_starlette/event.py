@@ -1,6 +1,12 @@
-import io
-import re
-from typing import Optional, Any, Union
+from typing import Optional, Any, Union, List, Dict, Callable, Iterable
+
+from sse_starlette._encoding import (
+    RETRY_BYTES,
+    encode_retry,
+    encode_data_only,
+    encode_text,
+    join_tagged_lines,
+)
 
 
 class ServerSentEvent:
@@ -8,9 +14,16 @@ class ServerSentEvent:
     Helper class to format data for Server-Sent Events (SSE).
     """
 
-    _LINE_SEP_EXPR = re.compile(r"\r\n|\r|\n")
+    __slots__ = ("data", "event", "id", "retry", "comment", "_sep", "_sep_bytes")
+
     DEFAULT_SEPARATOR = "\r\n"
 
+    TAG_COMMENT = b": "
+    TAG_ID = b"id: "
+    TAG_EVENT = b"event: "
+    TAG_DATA = b"data: "
+    TAG_RETRY = b"retry: "
+
     def __init__(
         self,
         data: Optional[Any] = None,
@@ -21,49 +34,108 @@ class ServerSentEvent:
         comment: Optional[str] = None,
         sep: Optional[str] = None,
     ) -> None:
-        self.data = data
+        if retry is not None and not isinstance(retry, int):
+            raise TypeError("retry argument must be int")
+        # Stringify up front so encode() normally takes the str fast path
+        self.data = data if data is None or isinstance(data, str) else str(data)
         self.event = event
         self.id = id
         self.retry = retry
         self.comment = comment
         self._sep = sep if sep is not None else self.DEFAULT_SEPARATOR
+        self._sep_bytes = self._sep.encode("utf-8")
 
     def encode(self) -> bytes:
-        buffer = io.StringIO()
+        if (
+            self.comment is None
+            and self.id is None
+            and self.event is None
+            and self.retry is None
+        ):
+            if self.data is None:
+                # Empty event: the frame is just the terminating separator
+                return self._sep_bytes
+            return encode_data_only(encode_text(self.data), self._sep_bytes)
+
+        # id, event and retry go in as separate (tag, value, sep) pieces that
+        # the final b"".join() copies once; comment and data lines are first
+        # joined by join_tagged_lines(), so those bytes are copied twice.
+        parts: List[bytes] = []
+        extend = parts.extend
+        sep = self._sep_bytes
+
         if self.comment is not None:
-            for chunk in self._LINE_SEP_EXPR.split(str(self.comment)):
-                buffer.write(f": {chunk}{self._sep}")
+            comment = encode_text(self.comment)
+            extend((join_tagged_lines(self.TAG_COMMENT, comment, sep), sep))
 
         if self.id is not None:
             # Clean newlines in the event id
-            buffer.write("id: " + self._LINE_SEP_EXPR.sub("", self.id) + self._sep)
+            id = encode_text(self.id)
+            extend((self.TAG_ID, id.translate(None, b"\r\n"), sep))
 
         if self.event is not None:
             # Clean newlines in the event name
-            buffer.write(
-                "event: " + self._LINE_SEP_EXPR.sub("", self.event) + self._sep
-            )
+            event = encode_text(self.event)
+            extend((self.TAG_EVENT, event.translate(None, b"\r\n"), sep))
 
         if self.data is not None:
             # Break multi-line data into multiple data: lines
-            for chunk in self._LINE_SEP_EXPR.split(str(self.data)):
-                buffer.write(f"data: {chunk}{self._sep}")
+            data = encode_text(self.data)
+            extend((join_tagged_lines(self.TAG_DATA, data, sep), sep))
 
         if self.retry is not None:
-            if not isinstance(self.retry, int):
-                raise TypeError("retry argument must be int")
-            buffer.write(f"retry: {self.retry}{self._sep}")
+            retry = RETRY_BYTES.get(self.retry) or encode_retry(self.retry)
+            extend((self.TAG_RETRY, retry, sep))
+
+        parts.append(sep)
+        return b"".join(parts)
+
+
+def encode_many(events: Iterable[ServerSentEvent]) -> bytes:
+    """
+    Encode several events into one chunk so they go out in a single send.
+    """
+    return b"".join([event.encode() for event in events])
+
+
+def _bytes_passthrough(data: bytes, sep: str) -> bytes:
+    return data
+
+
+def _encode_event(data: ServerSentEvent, sep: str) -> bytes:
+    return data.encode()
+
+
+def _encode_dict(data: dict, sep: str) -> bytes:
+    return ServerSentEvent(
+        data.get("data"),
+        event=data.get("event"),
+        id=data.get("id"),
+        retry=data.get("retry"),
+        comment=data.get("comment"),
+        sep=sep,
+    ).encode()
+
+
+def _encode_other(data: Any, sep: str) -> bytes:
+    return ServerSentEvent(data, sep=sep).encode()
+
 
-        buffer.write(self._sep)
-        return buffer.getvalue().encode("utf-8")
+# Exact-type handlers for ensure_bytes(); insertion order doubles as the
+# isinstance() precedence for subclasses.
+_ENSURE_DISPATCH: Dict[type, Callable[[Any, str], bytes]] = {
+    bytes: _bytes_passthrough,
+    ServerSentEvent: _encode_event,
+    dict: _encode_dict,
+    str: _encode_other,
+}
 
 
 def ensure_bytes(data: Union[bytes, dict, ServerSentEvent, Any], sep: str) -> bytes:
-    if isinstance(data, bytes):
-        return data
-    if isinstance(data, ServerSentEvent):
-        return data.encode()
-    if isinstance(data, dict):
-        data["sep"] = sep
-        return ServerSentEvent(**data).encode()
-    return ServerSentEvent(str(data), sep=sep).encode()
+    handler = _ENSURE_DISPATCH.get(type(data))
+    if handler is not None:
+        return handler(data, sep)
+    for cls, handler in _ENSURE_DISPATCH.items():
+        if isinstance(data, cls):
+            return handler(data, sep)
+    return _encode_other(data, sep)
@@ -1,15 +1,40 @@
-import io
-import re
-from abc import ABC, abstractmethod
-from typing import Optional, Any, Union
-
-
-class ServerSentEventABC(ABC):
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Any,
+    Union,
+    List,
+    Dict,
+    Callable,
+    Iterable,
+)
+
+from sse_starlette._encoding import (
+    RETRY_BYTES,
+    encode_retry,
+    encode_data_only,
+    encode_text,
+    join_tagged_lines,
+)
+
+
+class ServerSentEventABC:
     """
-    Abstract base class to format data for Server-Sent Events (SSE).
+    Base class to format data for Server-Sent Events (SSE).
+
+    Holds the shared slot layout and constructor. Each subclass sets
+    ``DEFAULT_SEPARATOR`` and implements ``encode`` itself, so the per-event
+    path has no extra dispatch.
     """
 
-    @abstractmethod
+    __slots__ = ("data", "event", "id", "retry", "comment", "_sep", "_sep_bytes")
+
+    DEFAULT_SEPARATOR: Union[str, bytes]
+
+    if TYPE_CHECKING:
+
+        def encode(self) -> bytes: ...
+
     def __init__(
         self,
         data: Optional[Any] = None,
@@ -20,51 +45,18 @@ class ServerSentEventABC(ABC):
         comment: Optional[Any] = None,
         sep: Optional[Any] = None,
     ) -> None:
+        if type(self) is ServerSentEventABC:
+            raise TypeError("ServerSentEventABC must be subclassed")
+        if retry is not None and not isinstance(retry, int):
+            raise TypeError("retry argument must be int")
         self.data = data
         self.event = event
         self.id = id
         self.retry = retry
         self.comment = comment
-        self._sep = sep if sep is not None else self.DEFAULT_SEPARATOR
-
-    def _encode(self, write) -> None:
-        if self.comment is not None:
-            for chunk in self._LINE_SEP_EXPR.split(self.comment):
-                write(self.TAG_COMMENT)
-                write(chunk)
-                write(self._sep)
-
-        if self.id is not None:
-            # Clean newlines in the event id
-            write(self.TAG_ID)
-            write(self._LINE_SEP_EXPR.sub(b"", self.id))
-            write(self._sep)
-
-        if self.event is not None:
-            # Clean newlines in the event name
-            write(self.TAG_EVENT)
-            write(self._LINE_SEP_EXPR.sub(b"", self.event))
-            write(self._sep)
-
-        if self.data is not None:
-            # Break multi-line data into multiple data: lines
-            for chunk in self._LINE_SEP_EXPR.split(self.data):
-                write(self.TAG_DATA)
-                write(chunk)
-                write(self._sep)
-
-        if self.retry is not None:
-            if not isinstance(self.retry, int):
-                raise TypeError("retry argument must be int")
-            write(self.TAG_RETRY)
-            write(str(self.retry).encode("utf-8"))
-            write(self._sep)
-
-        write(self._sep)
-
-    @abstractmethod
-    def encode(self) -> bytes:
-        return b""
+        sep = sep if sep is not None else self.DEFAULT_SEPARATOR
+        self._sep = sep
+        self._sep_bytes = sep if isinstance(sep, bytes) else sep.encode("utf-8")
 
 
 class ServerSentEvent(ServerSentEventABC):
@@ -72,14 +64,9 @@ class ServerSentEvent(ServerSentEventABC):
     Helper class to format data for Server-Sent Events (SSE).
     """
 
-    _LINE_SEP_EXPR = re.compile(r"\r\n|\r|\n")
-    DEFAULT_SEPARATOR = "\r\n"
+    __slots__ = ()
 
-    TAG_COMMENT = ": "
-    TAG_ID = "id: "
-    TAG_EVENT = "event: "
-    TAG_DATA = "data: "
-    TAG_RETRY = "retry: "
+    DEFAULT_SEPARATOR = "\r\n"
 
     def __init__(
         self,
@@ -91,18 +78,54 @@ class ServerSentEvent(ServerSentEventABC):
         comment: Optional[str] = None,
         sep: Optional[str] = None,
     ) -> None:
-        self.data = str(data)
-        self.event = event
-        self.id = id
-        self.retry = retry
-        self.comment = comment
-        self._sep = sep if sep is not None else self.DEFAULT_SEPARATOR
+        super().__init__(
+            data if data is None or isinstance(data, str) else str(data),
+            event=event,
+            id=id,
+            retry=retry,
+            comment=comment,
+            sep=sep,
+        )
 
     def encode(self) -> bytes:
-        buffer = io.StringIO()
-        write = buffer.write
-        self._encode(write)
-        return buffer.getvalue().encode("utf-8")
+        sep = self._sep_bytes
+        comment, id, event, data, retry = (
+            self.comment,
+            self.id,
+            self.event,
+            self.data,
+            self.retry,
+        )
+
+        if comment is None and id is None and event is None and retry is None:
+            if data is None:
+                # Empty event: the frame is just the terminating separator
+                return sep
+            return encode_data_only(encode_text(data), sep)
+
+        parts: List[bytes] = []
+        extend = parts.extend
+
+        if comment is not None:
+            extend((join_tagged_lines(b": ", encode_text(comment), sep), sep))
+
+        if id is not None:
+            # Clean newlines in the event id
+            extend((b"id: ", encode_text(id).translate(None, b"\r\n"), sep))
+
+        if event is not None:
+            # Clean newlines in the event name
+            extend((b"event: ", encode_text(event).translate(None, b"\r\n"), sep))
+
+        if data is not None:
+            # Break multi-line data into multiple data: lines
+            extend((join_tagged_lines(b"data: ", encode_text(data), sep), sep))
+
+        if retry is not None:
+            extend((b"retry: ", RETRY_BYTES.get(retry) or encode_retry(retry), sep))
+
+        parts.append(sep)
+        return b"".join(parts)
 
 
 class ServerSentEventBytes(ServerSentEventABC):
@@ -110,14 +133,9 @@ class ServerSentEventBytes(ServerSentEventABC):
     Helper class to format bytes data for Server-Sent Events (SSE).
     """
 
-    _LINE_SEP_EXPR = re.compile(br"\r\n|\r|\n")
-    DEFAULT_SEPARATOR = b"\n"
+    __slots__ = ()
 
-    TAG_COMMENT = b": "
-    TAG_ID = b"id: "
-    TAG_EVENT = b"event: "
-    TAG_DATA = b"data: "
-    TAG_RETRY = b"retry: "
+    DEFAULT_SEPARATOR = b"\n"
 
     def __init__(
         self,
@@ -129,25 +147,101 @@ class ServerSentEventBytes(ServerSentEventABC):
         comment: Optional[bytes] = None,
         sep: Optional[bytes] = None,
     ) -> None:
-        self.data = data
-        self.event = event
-        self.id = id
-        self.retry = retry
-        self.comment = comment
-        self._sep = sep if sep is not None else self.DEFAULT_SEPARATOR
+        super().__init__(
+            data, event=event, id=id, retry=retry, comment=comment, sep=sep
+        )
 
     def encode(self) -> bytes:
-        buffer = io.BytesIO()
-        self.encode(buffer.write)
-        return buffer.getvalue()
+        # Same layout as ServerSentEvent.encode, minus the UTF-8 encoding
+        sep = self._sep_bytes
+        comment, id, event, data, retry = (
+            self.comment,
+            self.id,
+            self.event,
+            self.data,
+            self.retry,
+        )
+
+        if comment is None and id is None and event is None and retry is None:
+            if data is None:
+                # Empty event: the frame is just the terminating separator
+                return sep
+            return encode_data_only(data, sep)
+
+        parts: List[bytes] = []
+        extend = parts.extend
+
+        if comment is not None:
+            extend((join_tagged_lines(b": ", comment, sep), sep))
+
+        if id is not None:
+            # Clean newlines in the event id
+            extend((b"id: ", id.translate(None, b"\r\n"), sep))
 
+        if event is not None:
+            # Clean newlines in the event name
+            extend((b"event: ", event.translate(None, b"\r\n"), sep))
 
-def ensure_bytes(data: Union[bytes, dict, ServerSentEventABC, Any], sep: str) -> bytes:
-    if isinstance(data, bytes):
-        return data
-    if isinstance(data, ServerSentEventABC):
-        return data.encode()
-    if isinstance(data, dict):
-        data["sep"] = sep
-        return ServerSentEvent(**data).encode()
+        if data is not None:
+            # Break multi-line data into multiple data: lines
+            extend((join_tagged_lines(b"data: ", data, sep), sep))
+
+        if retry is not None:
+            extend((b"retry: ", RETRY_BYTES.get(retry) or encode_retry(retry), sep))
+
+        parts.append(sep)
+        return b"".join(parts)
+
+
+def encode_many(events: Iterable[ServerSentEventABC]) -> bytes:
+    """
+    Encode several events into one chunk so they go out in a single send.
+    """
+    return b"".join([event.encode() for event in events])
+
+
+def _bytes_passthrough(data: bytes, sep: str) -> bytes:
+    return data
+
+
+def _encode_event(data: ServerSentEventABC, sep: str) -> bytes:
+    return data.encode()
+
+
+def _encode_dict(data: dict, sep: str) -> bytes:
+    return ServerSentEvent(
+        data.get("data"),
+        event=data.get("event"),
+        id=data.get("id"),
+        retry=data.get("retry"),
+        comment=data.get("comment"),
+        sep=sep,
+    ).encode()
+
+
+def _encode_other(data: Any, sep: str) -> bytes:
     return ServerSentEvent(data, sep=sep).encode()
+
+
+_EVENT_CLASSES = (ServerSentEvent, ServerSentEventBytes)
+
+# Exact-type handlers for ensure_bytes(); insertion order doubles as the
+# isinstance() precedence for subclasses.
+_ENSURE_DISPATCH: Dict[type, Callable[[Any, str], bytes]] = {
+    bytes: _bytes_passthrough,
+    **{cls: _encode_event for cls in _EVENT_CLASSES},
+    dict: _encode_dict,
+    str: _encode_other,
+    # Only reached through the isinstance() fallback, for user subclasses
+    ServerSentEventABC: _encode_event,
+}
+
+
+def ensure_bytes(data: Union[bytes, dict, ServerSentEventABC, Any], sep: str) -> bytes:
+    handler = _ENSURE_DISPATCH.get(type(data))
+    if handler is not None:
+        return handler(data, sep)
+    for cls, handler in _ENSURE_DISPATCH.items():
+        if isinstance(data, cls):
+            return handler(data, sep)
+    return _encode_other(data, sep)
@@ -1,6 +1,16 @@
-import io
-import re
-from typing import Optional, Any, Union
+import logging
+from types import ModuleType
+from typing import Optional, Any, Union, List, Dict, Callable
+
+from sse_starlette._encoding import (
+    RETRY_BYTES,
+    encode_data_only,
+    encode_retry,
+    encode_text,
+    join_tagged_lines,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class ServerSentEvent:
@@ -8,7 +18,8 @@ class ServerSentEvent:
     Helper class to format data for Server-Sent Events (SSE).
     """
 
-    _LINE_SEP_EXPR = re.compile(r"\r\n|\r|\n")
+    __slots__ = ("data", "event", "id", "retry", "comment", "_sep", "_sep_bytes")
+
     DEFAULT_SEPARATOR = "\r\n"
 
     def __init__(
@@ -21,49 +32,148 @@ class ServerSentEvent:
         comment: Optional[str] = None,
         sep: Optional[str] = None,
     ) -> None:
-        self.data = data
+        if retry is not None and not isinstance(retry, int):
+            raise TypeError("retry argument must be int")
+        self.data = data if data is None or isinstance(data, str) else str(data)
         self.event = event
         self.id = id
         self.retry = retry
         self.comment = comment
         self._sep = sep if sep is not None else self.DEFAULT_SEPARATOR
+        self._sep_bytes = self._sep.encode("utf-8")
 
     def encode(self) -> bytes:
-        buffer = io.StringIO()
+        sep = self._sep_bytes
+        if (
+            self.comment is None
+            and self.id is None
+            and self.event is None
+            and self.retry is None
+        ):
+            if self.data is None:
+                # Empty event: the frame is just the terminating separator
+                return sep
+            return encode_data_only(encode_text(self.data), sep)
+
+        parts: List[bytes] = []
+        extend = parts.extend
         if self.comment is not None:
-            for chunk in self._LINE_SEP_EXPR.split(str(self.comment)):
-                buffer.write(f": {chunk}{self._sep}")
+            extend((join_tagged_lines(b": ", encode_text(self.comment), sep), sep))
 
         if self.id is not None:
             # Clean newlines in the event id
-            buffer.write("id: " + self._LINE_SEP_EXPR.sub("", self.id) + self._sep)
+            extend((b"id: ", encode_text(self.id).translate(None, b"\r\n"), sep))
 
         if self.event is not None:
             # Clean newlines in the event name
-            buffer.write(
-                "event: " + self._LINE_SEP_EXPR.sub("", self.event) + self._sep
-            )
+            extend((b"event: ", encode_text(self.event).translate(None, b"\r\n"), sep))
 
         if self.data is not None:
             # Break multi-line data into multiple data: lines
-            for chunk in self._LINE_SEP_EXPR.split(str(self.data)):
-                buffer.write(f"data: {chunk}{self._sep}")
+            extend((join_tagged_lines(b"data: ", encode_text(self.data), sep), sep))
 
         if self.retry is not None:
-            if not isinstance(self.retry, int):
-                raise TypeError("retry argument must be int")
-            buffer.write(f"retry: {self.retry}{self._sep}")
+            retry = RETRY_BYTES.get(self.retry) or encode_retry(self.retry)
+            extend((b"retry: ", retry, sep))
 
-        buffer.write(self._sep)
-        return buffer.getvalue().encode("utf-8")
+        parts.append(sep)
+        return b"".join(parts)
 
 
-_LINE_SEP_EXPR_BYTES = re.compile(rb"\r\n|\r|\n")
 DEFAULT_SEPARATOR_BYTES = b"\r\n"
 
+# Payloads smaller than this are formatted in pure Python: below it, the fixed
+# cost of dispatching into the compiled formatter outweighs the faster scan.
+NUMBA_MIN_DATA_SIZE = 16 * 1024
+
+# sse_starlette._numba_kernels once loaded; False when numba is unavailable,
+# None until load_numba_formatter() is called
+_numba: Union[ModuleType, bool, None] = None
+
+
+def load_numba_formatter() -> bool:
+    """
+    Import and compile the Numba formatter used for large payloads.
+
+    :func:`event_from_bytes` only uses the compiled formatter, for data of at
+    least ``NUMBA_MIN_DATA_SIZE`` bytes, once this has been called. Importing
+    numba and compiling the kernels is slow and blocks, so call it at startup
+    rather than from a request. Requires the ``numba`` extra.
+
+    :return: Whether the Numba formatter is available.
+    """
+    global _numba
+    if _numba is None:
+        try:
+            from sse_starlette import _numba_kernels
+
+            _numba = _numba_kernels
+            # Compile every kernel now rather than on the first real event
+            _event_from_bytes_numba(b"x\ny", b"e", b"1", 1, b"c", b"\r\n")
+        except ImportError:
+            _numba = False
+        except Exception:
+            # numba raises e.g. RuntimeError when no cache directory is writable
+            logger.warning("Numba formatter unavailable", exc_info=True)
+            _numba = False
+    return _numba is not False
+
+
+def _event_from_bytes_numba(
+    data: Optional[bytes],
+    event: Optional[bytes],
+    id: Optional[bytes],  # noqa: W0622
+    retry: Optional[int],
+    comment: Optional[bytes],
+    sep: bytes,
+) -> bytes:
+    """Numba-backed equivalent of :func:`event_from_bytes`."""
+    kernels = _numba
+    assert isinstance(kernels, ModuleType), "call load_numba_formatter() first"
+    np = kernels.np
+    retry_bytes = (
+        None if retry is None else RETRY_BYTES.get(retry) or encode_retry(retry)
+    )
+    fields = 0
+    size = len(sep)
+    lines = 0
+    for flag, value in (
+        (kernels.HAS_COMMENT, comment),
+        (kernels.HAS_ID, id),
+        (kernels.HAS_EVENT, event),
+        (kernels.HAS_DATA, data),
+        (kernels.HAS_RETRY, retry_bytes),
+    ):
+        if value is not None:
+            fields |= flag
+            size += len(value)
+            lines += 1
+    for value in (comment, data):
+        if value is not None:
+            # Worst case every byte is a CR/LF starting another tagged line;
+            # np.empty() does not touch the pages, so over-sizing is cheap.
+            lines += len(value)
+    # Every line carries a tag and a separator; sep can be any length here.
+    size += lines * (kernels.MAX_TAG_LEN + len(sep))
+
+    def view(value: Optional[bytes]) -> Any:
+        return np.frombuffer(value or b"", np.uint8)
+
+    out = np.empty(size, np.uint8)
+    n = kernels.format_sse_bytes(
+        out,
+        view(data),
+        view(event),
+        view(id),
+        view(retry_bytes),
+        view(comment),
+        view(sep),
+        fields,
+    )
+    return out[:n].tobytes()
+
 
 def event_from_bytes(
-    self,
     data: Optional[bytes] = None,
     *,
     event: Optional[bytes] = None,
@@ -84,53 +194,87 @@ def event_from_bytes(
     :return: The formatted message as bytes.
     """
 
-    buffer = io.BytesIO()
-    write = buffer.write
+    parts: List[bytes] = []
+    extend = parts.extend
 
     _sep = sep if sep is not None else DEFAULT_SEPARATOR_BYTES
 
+    if retry is not None and not isinstance(retry, int):
+        raise TypeError("retry argument must be int")
+
+    if (
+        data is None
+        and comment is None
+        and id is None
+        and event is None
+        and retry is None
+    ):
+        # Empty event: the frame is just the terminating separator
+        return _sep
+
+    if _numba and data is not None and len(data) >= NUMBA_MIN_DATA_SIZE:
+        return _event_from_bytes_numba(data, event, id, retry, comment, _sep)
+
     if comment is not None:
-        for chunk in _LINE_SEP_EXPR_BYTES.split(comment):
-            write(b": ")
-            write(chunk)
-            write(_sep)
+        extend((join_tagged_lines(b": ", comment, _sep), _sep))
 
     if id is not None:
         # Clean newlines in the event id
-        write(b"id: ")
-        write(_LINE_SEP_EXPR_BYTES.sub(b"", id))
-        write(_sep)
+        extend((b"id: ", id.translate(None, b"\r\n"), _sep))
 
     if event is not None:
         # Clean newlines in the event name
-        write(b"event: ")
-        write(_LINE_SEP_EXPR_BYTES.sub(b"", event))
-        write(_sep)
+        extend((b"event: ", event.translate(None, b"\r\n"), _sep))
 
     if data is not None:
         # Break multi-line data into multiple data: lines
-        for chunk in _LINE_SEP_EXPR_BYTES.split(data):
-            write(b"data: ")
-            write(chunk)
-            write(_sep)
+        extend((join_tagged_lines(b"data: ", data, _sep), _sep))
 
     if retry is not None:
-        if not isinstance(retry, int):
-            raise TypeError("retry argument must be int")
-        write(b"retry: ")
-        write(str(retry).encode("utf-8"))
-        write(_sep)
+        extend((b"retry: ", RETRY_BYTES.get(retry) or encode_retry(retry), _sep))
+
+    parts.append(_sep)
+    return b"".join(parts)
+
+
+def _bytes_passthrough(data: bytes, sep: str) -> bytes:
+    return data
+
+
+def _encode_event(data: ServerSentEvent, sep: str) -> bytes:
+    return data.encode()
+
+
+def _encode_dict(data: dict, sep: str) -> bytes:
+    return ServerSentEvent(
+        data.get("data"),
+        event=data.get("event"),
+        id=data.get("id"),
+        retry=data.get("retry"),
+        comment=data.get("comment"),
+        sep=sep,
+    ).encode()
+
+
+def _encode_other(data: Any, sep: str) -> bytes:
+    return ServerSentEvent(data, sep=sep).encode()
+
 
-    write(_sep)
-    return buffer.getvalue()
+# Exact-type handlers for ensure_bytes(); insertion order doubles as the
+# isinstance() precedence for subclasses.
+_ENSURE_DISPATCH: Dict[type, Callable[[Any, str], bytes]] = {
+    bytes: _bytes_passthrough,
+    ServerSentEvent: _encode_event,
+    dict: _encode_dict,
+    str: _encode_other,
+}
 
 
 def ensure_bytes(data: Union[bytes, dict, ServerSentEvent, Any], sep: str) -> bytes:
-    if isinstance(data, bytes):
-        return data
-    if isinstance(data, ServerSentEvent):
-        return data.encode()
-    if isinstance(data, dict):
-        data["sep"] = sep
-        return ServerSentEvent(**data).encode()
-    return ServerSentEvent(str(data), sep=sep).encode()
+    handler = _ENSURE_DISPATCH.get(type(data))
+    if handler is not None:
+        return handler(data, sep)
+    for cls, handler in _ENSURE_DISPATCH.items():
+        if isinstance(data, cls):
+            return handler(data, sep)
+    return _encode_other(data, sep)
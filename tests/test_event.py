@@ -1,6 +1,8 @@
 import pytest
 
-from sse_starlette.event import ServerSentEvent, ensure_bytes
+from sse_starlette import _encoding
+from sse_starlette import event as event_module
+from sse_starlette.event import ServerSentEvent, encode_many, ensure_bytes
 
 
 @pytest.mark.parametrize(
@@ -100,3 +102,107 @@ def test_retry_is_int():
     with pytest.raises(TypeError) as ctx:
         _ = ServerSentEvent(0, retry="ten").encode()  # type: ignore
     assert str(ctx.value) == "retry argument must be int"
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ("", b"data: \n\n"),
+        ("foo\n", b"data: foo\ndata: \n\n"),
+        ("foo\r\n\rbar", b"data: foo\ndata: \ndata: bar\n\n"),
+        ("foo\x0cbar xyz", "data: foo\x0cbar xyz\n\n".encode()),
+    ],
+    ids=("empty", "trailing-LF", "CR+LF-then-CR", "non-SSE-line-breaks"),
+)
+def test_data_line_splitting(data, expected):
+    assert ServerSentEvent(data, sep="\n").encode() == expected
+
+
+def test_ensure_bytes_subclasses():
+    class Payload(str):
+        pass
+
+    class Event(ServerSentEvent):
+        pass
+
+    assert ensure_bytes(Payload("foo"), sep="\n") == b"data: foo\n\n"
+    assert ensure_bytes(Event("foo", sep="\n"), sep="\n") == b"data: foo\n\n"
+    assert ensure_bytes(1, sep="\n") == b"data: 1\n\n"
+
+
+def test_ensure_bytes_does_not_mutate_dict():
+    data = dict(data="foo", event="bar")
+    assert ensure_bytes(data, sep="\n") == b"event: bar\ndata: foo\n\n"
+    assert data == dict(data="foo", event="bar")
+
+
+@pytest.mark.parametrize("line_sep", ["\n", "\r\n"], ids=("LF", "CR+LF"))
+@pytest.mark.parametrize("event", [None, "ev"])
+def test_large_multiline_data(line_sep, event):
+    lines = ["x" * 50, "", "y" * 50, ""]
+    result = ServerSentEvent(line_sep.join(lines), event=event, sep="\r\n").encode()
+    expected = "".join(f"data: {line}\r\n" for line in lines) + "\r\n"
+    if event is not None:
+        expected = f"event: {event}\r\n" + expected
+    assert result == expected.encode()
+
+
+def test_encode_many():
+    events = [ServerSentEvent("foo", sep="\n"), ServerSentEvent("bar", id="1")]
+    assert encode_many(events) == b"data: foo\n\nid: 1\r\ndata: bar\r\n\r\n"
+    assert encode_many([]) == b""
+
+
+def test_retry_is_validated_on_construction():
+    with pytest.raises(TypeError, match="retry argument must be int"):
+        ServerSentEvent(0, retry=1.5)  # type: ignore
+
+
+@pytest.mark.parametrize("sep", ["\n", "\r", "\r\n"], ids=("LF", "CR", "CR+LF"))
+def test_empty_event(sep):
+    assert ServerSentEvent(sep=sep).encode() == sep.encode()
+
+
+@pytest.mark.parametrize("retry", [0, 3000, -1])
+def test_retry_encoding(retry):
+    result = ServerSentEvent("foo", retry=retry, sep="\n").encode()
+    assert result == f"data: foo\nretry: {retry}\n\n".encode()
+
+
+def test_retry_encoding_cache(monkeypatch):
+    cache = _encoding.RETRY_BYTES
+    saved = dict(cache)
+    cache.clear()
+    monkeypatch.setattr(_encoding, "RETRY_BYTES_MAX", 2)
+    try:
+        assert ServerSentEvent(retry=3000, sep="\n").encode() == b"retry: 3000\n\n"
+        assert list(cache) == [3000]
+
+        # A cached value is reused without encoding it again
+        def fail(retry):
+            raise AssertionError(retry)
+
+        monkeypatch.setattr(event_module, "encode_retry", fail)
+        assert ServerSentEvent(retry=3000, sep="\n").encode() == b"retry: 3000\n\n"
+        monkeypatch.setattr(event_module, "encode_retry", _encoding.encode_retry)
+
+        for retry in (1, 2, 3):
+            expected = b"retry: %d\n\n" % retry
+            assert ServerSentEvent(retry=retry, sep="\n").encode() == expected
+        # The cache stops growing at RETRY_BYTES_MAX
+        assert list(cache) == [3000, 1]
+    finally:
+        cache.clear()
+        cache.update(saved)
+
+
+def test_non_str_fields_are_stringified():
+    event = ServerSentEvent({"a": 1}, id=5, event=1.5)  # type: ignore
+    assert event.data == "{'a': 1}"
+    assert event.encode() == b"id: 5\r\nevent: 1.5\r\ndata: {'a': 1}\r\n\r\n"
+
+
+def test_reassigned_data_is_stringified():
+    event = ServerSentEvent("x")
+    event.data = {"a": 1}
+    assert event.encode() == b"data: {'a': 1}\r\n\r\n"
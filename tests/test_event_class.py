@@ -0,0 +1,93 @@
+import pytest
+
+from sse_starlette.event_class import (
+    ServerSentEventABC,
+    ServerSentEvent,
+    ServerSentEventBytes,
+    encode_many,
+    ensure_bytes,
+)
+
+
+@pytest.mark.parametrize(
+    "input, expected",
+    [
+        (dict(data=b"foo"), b"data: foo\n\n"),
+        (dict(data=b"foo", event=b"bar"), b"event: bar\ndata: foo\n\n"),
+        (
+            dict(data=b"foo", event=b"bar", id=b"xyz", retry=1),
+            b"id: xyz\nevent: bar\ndata: foo\nretry: 1\n\n",
+        ),
+        (
+            dict(data=b"foo\r\nbar\rxyz\n", comment=b"a\ncomment", sep=b"\r\n"),
+            b": a\r\n: comment\r\n"
+            b"data: foo\r\ndata: bar\r\ndata: xyz\r\ndata: \r\n\r\n",
+        ),
+        (dict(id=b"x\r\ny", event=b"e\nv"), b"id: xy\nevent: ev\n\n"),
+    ],
+)
+def test_server_sent_event_bytes(input, expected):
+    assert ServerSentEventBytes(**input).encode() == expected
+
+
+@pytest.mark.parametrize("cls", [ServerSentEvent, ServerSentEventBytes])
+def test_str_and_bytes_events_agree(cls):
+    def field(value):
+        return value if cls is ServerSentEvent else value.encode()
+
+    result = cls(
+        field("foo\nbar"),
+        event=field("ev"),
+        id=field("1"),
+        retry=3,
+        comment=field("c"),
+        sep=field("\r\n"),
+    ).encode()
+    assert result == (
+        b": c\r\nid: 1\r\nevent: ev\r\ndata: foo\r\ndata: bar\r\nretry: 3\r\n\r\n"
+    )
+
+
+def test_ensure_bytes_passes_events_through():
+    event = ServerSentEventBytes(b"foo")
+    assert ensure_bytes(event, sep="\n") == b"data: foo\n\n"
+
+
+def test_str_event_without_data():
+    event = ServerSentEvent(comment="ping")
+    assert event.data is None
+    assert event.encode() == b": ping\r\n\r\n"
+    assert ServerSentEvent(1).data == "1"
+
+
+def test_encode_many():
+    events = [ServerSentEvent("foo"), ServerSentEventBytes(b"bar", id=b"1")]
+    assert encode_many(events) == b"data: foo\r\n\r\nid: 1\ndata: bar\n\n"
+
+
+def test_empty_event():
+    assert ServerSentEvent().encode() == b"\r\n"
+    assert ServerSentEventBytes(sep=b"\r").encode() == b"\r"
+
+
+def test_abc_is_not_instantiable():
+    with pytest.raises(TypeError):
+        ServerSentEventABC()  # type: ignore
+
+
+def test_ensure_bytes_uses_subclass_encode():
+    class Custom(ServerSentEventABC):
+        DEFAULT_SEPARATOR = "\n"
+
+        def encode(self) -> bytes:
+            return b"custom\n\n"
+
+    assert ensure_bytes(Custom(), sep="\n") == b"custom\n\n"
+
+
+def test_reassigned_data_is_stringified():
+    event = ServerSentEvent("x", id="1")
+    event.data = 5
+    assert event.encode() == b"id: 1\r\ndata: 5\r\n\r\n"
+    event.id = None
+    assert event.encode() == b"data: 5\r\n\r\n"
@@ -0,0 +1,101 @@
+import pytest
+
+from sse_starlette import event_function
+from sse_starlette.event_function import event_from_bytes
+
+
+@pytest.mark.parametrize(
+    "input, expected",
+    [
+        (dict(data=b"foo"), b"data: foo\r\n\r\n"),
+        (
+            dict(data=b"foo\nbar\r", event=b"e\nv", id=b"x\ry", retry=1, sep=b"\n"),
+            b"id: xy\nevent: ev\ndata: foo\ndata: bar\ndata: \nretry: 1\n\n",
+        ),
+        (dict(comment=b"a\r\ncomment", sep=b"\n"), b": a\n: comment\n\n"),
+    ],
+)
+def test_event_from_bytes(input, expected):
+    assert event_from_bytes(**input) == expected
+
+
+def test_event_from_bytes_positional_data():
+    assert event_from_bytes(b"x") == b"data: x\r\n\r\n"
+
+
+def test_event_from_bytes_retry_is_int():
+    with pytest.raises(TypeError, match="retry argument must be int"):
+        event_from_bytes(b"foo", retry="ten")  # type: ignore
+
+
+@pytest.mark.parametrize("sep", [b"\n", b"\r", b"\r\n"], ids=("LF", "CR", "CR+LF"))
+@pytest.mark.parametrize(
+    "data",
+    [b"", b"foo", b"foo\r\n\r\nbar\r", b"\n" * 5, b"x" * 100 + b"\r\n" + b"y" * 100],
+)
+def test_numba_formatter_matches_python(data, sep):
+    if not event_function.load_numba_formatter():
+        pytest.skip("numba is not installed")
+    kwargs = dict(event=b"ev\n", id=b"1\r", retry=3000, comment=b"c\nd")
+    expected = event_from_bytes(data, sep=sep, **kwargs)
+    assert event_function._event_from_bytes_numba(data, sep=sep, **kwargs) == expected
+
+
+def test_empty_event():
+    assert event_from_bytes(sep=b"\n") == b"\n"
+    assert event_function.ServerSentEvent(sep="\r").encode() == b"\r"
+
+
+@pytest.mark.parametrize("sep", [b"\r\n\r\n", b"<sep-sep-sep-sep>"])
+def test_numba_formatter_with_long_separator(sep):
+    if not event_function.load_numba_formatter():
+        pytest.skip("numba is not installed")
+    data = b"\n" * 1024 + b"\r" * 1024
+    kwargs = dict(event=b"ev", id=b"1", retry=3000, comment=b"\n" * 64)
+    expected = event_from_bytes(data, sep=sep, **kwargs)
+    assert event_function._event_from_bytes_numba(data, sep=sep, **kwargs) == expected
+
+
+def test_str_event_stringifies_non_str_fields():
+    event = event_function.ServerSentEvent(1, id=5, event=1.5)  # type: ignore
+    assert event.encode() == b"id: 5\r\nevent: 1.5\r\ndata: 1\r\n\r\n"
+
+
+def test_numba_formatter_is_not_loaded_implicitly(monkeypatch):
+    monkeypatch.setattr(event_function, "_numba", None)
+    data = b"x" * event_function.NUMBA_MIN_DATA_SIZE
+    assert event_from_bytes(data) == b"data: " + data + b"\r\n\r\n"
+    assert event_function._numba is None
+
+
+def test_load_numba_formatter_survives_compile_errors(monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("cannot cache function")
+
+    monkeypatch.setattr(event_function, "_numba", None)
+    monkeypatch.setattr(event_function, "_event_from_bytes_numba", fail)
+    assert event_function.load_numba_formatter() is False
+    assert event_from_bytes(b"x" * event_function.NUMBA_MIN_DATA_SIZE)
+
+
+def test_str_event_matches_event_module():
+    from sse_starlette.event import ServerSentEvent
+
+    kwargs = dict(event="e\nv", id="1\r", retry=3000, comment="a\r\nb", sep="\n")
+    data = "foo\r\nbar\v baz\r"
+    assert (
+        event_function.ServerSentEvent(data, **kwargs).encode()
+        == ServerSentEvent(data, **kwargs).encode()
+    )
+
+
+def test_ensure_bytes():
+    ensure_bytes = event_function.ensure_bytes
+
+    class Payload(dict):
+        pass
+
+    assert ensure_bytes(b"raw", sep="\n") == b"raw"
+    assert ensure_bytes({"data": "foo", "id": 1}, sep="\n") == b"id: 1\ndata: foo\n\n"
+    assert ensure_bytes(Payload(data="foo"), sep="\n") == b"data: foo\n\n"
+    assert ensure_bytes(1, sep="\n") == b"data: 1\n\n"